@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import contextlib
-import json
+import copy
+import errno
+import functools
 import os
+import selectors
+import shutil
 import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from enum import StrEnum
 from pathlib import Path
@@ -17,7 +21,7 @@ from urllib.parse import urlparse
 import typer
 import yaml
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 # ----------------------------
 # CLI
@@ -25,6 +29,9 @@ from pydantic import BaseModel, Field, ValidationError
 
 app = typer.Typer(no_args_is_help=True, add_completion=False)
 
+# libyaml-backed loader when available; resolved once at import time
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ----------------------------
 # Models
@@ -77,18 +84,45 @@ class Config(BaseModel):
     mcp_client_variant: str = "stdio"
 
 
+class ResolvedMcp(BaseModel):
+    """Selected MCP server/client definitions, flattened for the startup path."""
+    server_type: Literal["stdio", "http"]
+    client_type: Literal["stdio", "http"]
+    server_cmd: list[str] = Field(default_factory=list)
+    server_url: Optional[str] = None
+    client_path: Optional[str] = None
+
+
+class MCPServerDef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["stdio", "http"]
+    cmd: list[str] = Field(default_factory=list)
+    url: Optional[str] = None
+
+
+class MCPClientDef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["stdio", "http"]
+    client_path: Optional[str] = None
+    cmd: list[str] = Field(default_factory=list)
+    args: list[str] = Field(default_factory=list)
+
+
+class MCPBundle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    servers: dict[str, MCPServerDef] = Field(default_factory=dict)
+    clients: dict[str, MCPClientDef] = Field(default_factory=dict)
+
+
 class Lookups(BaseModel):
     # e.g., {"openai": "https://api.openai.com", "anthropic": "https://api.anthropic.com"}
     model_reverse_target: dict[str, str]
-    # Per agent, variants for servers and clients
-    # {
-    #   "pydanticai": {
-    #       "servers": {"stdio": {"type":"stdio","cmd":[...]}, "http": {"type":"http","url":"...","cmd":[...] }},
-    #       "clients": {"stdio": {"type":"stdio","client_path":"..."}, "http": {"type":"http","client_path":"..."}}
-    #   },
-    #   "crewai": {...}
-    # }
-    mcp: dict[str, dict[str, dict[str, dict[str, object]]]]
+    # Per agent, server and client variants — validated once here so the
+    # startup path reads attributes instead of walking untyped dicts
+    mcp: dict[AgentProvider, MCPBundle]
 
 
 # ----------------------------
@@ -100,35 +134,130 @@ def die(msg: str) -> NoReturn:
     raise SystemExit(1)
 
 
+_MISSING = object()
+
+
 def _deep_merge(a: dict, b: dict) -> None:
     """Deep-merge b into a."""
-    for k, v in b.items():
-        if isinstance(v, dict) and isinstance(a.get(k), dict):
-            _deep_merge(a[k], v)
-        else:
-            a[k] = v
+    stack = [(a, b)]
+    while stack:
+        da, db = stack.pop()
+        for k, v in db.items():
+            av = da.get(k, _MISSING)
+            if isinstance(v, dict) and isinstance(av, dict):
+                stack.append((av, v))
+            else:
+                da[k] = v
 
 
 def wait_port(host: str, port: int, timeout: float = 20.0) -> bool:
-    end = time.time() + timeout
-    while time.time() < end:
-        with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-            s.settimeout(0.5)
-            try:
-                if s.connect_ex((host, port)) == 0:
-                    return True
-            except OSError:
-                pass
-        time.sleep(0.2)
-    return False
+    deadline = time.monotonic() + timeout
+    backoff = 0.01
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setblocking(False)
+        try:
+            err = s.connect_ex((host, port))
+            if err == 0:
+                return True
+            if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                # Block exactly until the connect resolves or the deadline hits.
+                with selectors.DefaultSelector() as sel:
+                    sel.register(s, selectors.EVENT_WRITE)
+                    if sel.select(timeout=remaining) and s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return True
+        except OSError:
+            pass
+        finally:
+            s.close()
+        # Refused outright (service not listening yet): back off exponentially
+        # so fast-starting services are detected quickly.
+        time.sleep(min(backoff, max(0.0, deadline - time.monotonic())))
+        backoff = min(backoff * 2, 0.2)
+
+
+def wait_ports(targets: list[tuple[str, str, int, float]]) -> Optional[str]:
+    """Probe several (name, host, port, timeout) targets with one selector loop.
+
+    Drives all non-blocking connects from a single thread; returns None once
+    every port accepts, or the name of the first target whose deadline expires.
+    """
+    now = time.monotonic()
+    states: dict[str, dict] = {
+        name: {"addr": (host, port), "deadline": now + timeout, "sock": None,
+               "backoff": 0.01, "retry_at": now}
+        for name, host, port, timeout in targets
+    }
+    sel = selectors.DefaultSelector()
+    try:
+        while states:
+            now = time.monotonic()
+            for name, st in states.items():
+                if now >= st["deadline"]:
+                    return name
+
+            # (Re)issue connects whose backoff has elapsed
+            done: list[str] = []
+            for name, st in states.items():
+                if st["sock"] is not None or now < st["retry_at"]:
+                    continue
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                s.setblocking(False)
+                err = s.connect_ex(st["addr"])
+                if err == 0:
+                    s.close()
+                    done.append(name)
+                elif err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    st["sock"] = s
+                    sel.register(s, selectors.EVENT_WRITE, name)
+                else:
+                    s.close()
+                    st["retry_at"] = now + st["backoff"]
+                    st["backoff"] = min(st["backoff"] * 2, 0.2)
+            for name in done:
+                del states[name]
+            if not states:
+                return None
+
+            wake_at = min(
+                min(st["deadline"] for st in states.values()),
+                min((st["retry_at"] for st in states.values() if st["sock"] is None),
+                    default=float("inf")),
+            )
+            for key, _ in sel.select(timeout=max(0.0, wake_at - time.monotonic())):
+                name = key.data
+                s = key.fileobj
+                sel.unregister(s)
+                ok = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                s.close()
+                st = states.get(name)
+                if st is None:
+                    continue
+                st["sock"] = None
+                if ok:
+                    del states[name]
+                else:
+                    st["retry_at"] = time.monotonic() + st["backoff"]
+                    st["backoff"] = min(st["backoff"] * 2, 0.2)
+        return None
+    finally:
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
 
 
 def is_host_only_url(url: str) -> bool:
     """Return True if URL is scheme+host (no path/query/fragment)."""
-    u = urlparse(url)
-    if not u.scheme or not u.netloc:
+    scheme, sep, rest = url.partition("://")
+    if not scheme or not sep:
         return False
-    return (u.path in ("", "/")) and (not u.params) and (not u.query) and (not u.fragment)
+    host = rest[:-1] if rest.endswith("/") else rest  # allow a bare trailing slash
+    if not host:
+        return False
+    return not any(c in host for c in "/?#")
 
 
 # ----------------------------
@@ -136,10 +265,28 @@ def is_host_only_url(url: str) -> bool:
 # ----------------------------
 
 def load_all(config_path: str, profile: Optional[str]) -> Tuple[Config, Lookups, dict]:
-    raw = yaml.safe_load(Path(config_path).read_text())
+    # Key the cache on mtime so edits to the file invalidate stale entries.
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    cfg, lookups, raw = _load_all_cached(os.path.abspath(config_path), mtime_ns, profile)
+    # CLI overrides mutate the Config downstream; hand out a copy so the
+    # cached instance stays pristine.
+    return cfg.model_copy(deep=True), lookups, raw
+
 
-    # Start with defaults
-    cfg_dict = dict(raw.get("defaults", {}))
+@functools.lru_cache(maxsize=4)
+def _read_raw(config_path: str, mtime_ns: int) -> dict:
+    # Parsing is profile-independent; cache it separately so switching
+    # profiles against the same file never re-tokenizes the document.
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_all_cached(config_path: str, mtime_ns: int, profile: Optional[str]) -> Tuple[Config, Lookups, dict]:
+    raw = _read_raw(config_path, mtime_ns)
+
+    # Start with defaults; deep-copied because profile merges mutate nested
+    # dicts and the raw document is shared across cache entries.
+    cfg_dict = copy.deepcopy(raw.get("defaults", {}))
 
     # Apply profile overrides (if any)
     if profile:
@@ -165,7 +312,7 @@ def load_all(config_path: str, profile: Optional[str]) -> Tuple[Config, Lookups,
         die(f"Invalid 'lookups' config: {e}")
 
 
-    cfg_dict["client"] = lookups.mcp[cfg_dict["agent_provider"]]["clients"][cfg_dict["mcp_client_variant"]]
+    cfg_dict["client"] = lookups.mcp[cfg_dict["agent_provider"]].clients[cfg_dict["mcp_client_variant"]].model_dump()
 
     try:
         cfg = Config.model_validate(cfg_dict)
@@ -175,10 +322,45 @@ def load_all(config_path: str, profile: Optional[str]) -> Tuple[Config, Lookups,
     return cfg, lookups, raw
 
 
+def resolve_mcp(lookups: Lookups, agent: str, server_variant: str, client_variant: str) -> ResolvedMcp:
+    """Flatten the selected MCP server/client defs into one validated model."""
+    agent_mcp = lookups.mcp.get(agent)
+    if not agent_mcp:
+        die(f"No MCP lookups for agent '{agent}' in lookups.mcp")
+
+    server_def = agent_mcp.servers.get(server_variant)
+    client_def = agent_mcp.clients.get(client_variant)
+
+    if not server_def:
+        die(f"No MCP server variant '{server_variant}' for agent '{agent}'")
+    if not client_def:
+        die(f"No MCP client variant '{client_variant}' for agent '{agent}'")
+
+    # Fields were already validated when the Lookups model was built
+    return ResolvedMcp(
+        server_type=server_def.type,
+        client_type=client_def.type,
+        server_cmd=list(server_def.cmd),
+        server_url=server_def.url,
+        client_path=client_def.client_path,
+    )
+
+
 # ----------------------------
 # Process starters
 # ----------------------------
 
+def _spawn(cmd: list[str], env: dict) -> subprocess.Popen:
+    """Popen tuned so CPython takes its posix_spawn fast path (no fork).
+
+    posix_spawn is only used when close_fds is False and the executable path
+    is already resolved, so look the command up on PATH up front. Avoids
+    CoW-duplicating the orchestrator's memory map for every child.
+    """
+    exe = shutil.which(cmd[0]) or cmd[0]
+    return subprocess.Popen([exe, *cmd[1:]], env=env, close_fds=False)
+
+
 def start_tracing_api(cfg: TracingCfg, env: dict) -> subprocess.Popen:
     # Example assumes uvicorn module path trace_api.app:app exists in your repo
     cmd = [
@@ -191,15 +373,15 @@ def start_tracing_api(cfg: TracingCfg, env: dict) -> subprocess.Popen:
         "--port",
         str(cfg.port),
     ]
-    return subprocess.Popen(cmd, env=env)
+    return _spawn(cmd, env)
 
 
 def start_proxy(kind: ProxyKind, listen_host: str, listen_port: int, reverse_target: str, env: dict) -> Optional[
     subprocess.Popen]:
-    if kind == "none":
+    if kind is ProxyKind.none:
         return None
 
-    if kind == "mitmproxy":
+    if kind is ProxyKind.mitmproxy:
         # Reverse mode: the target MUST be scheme+host only (no path)
         if not is_host_only_url(reverse_target):
             die("Proxy reverse_target must be base host (e.g., https://api.openai.com), not a path.")
@@ -214,7 +396,7 @@ def start_proxy(kind: ProxyKind, listen_host: str, listen_port: int, reverse_tar
             "--listen-port",
             str(listen_port),
         ]
-        return subprocess.Popen(cmd, env=env)
+        return _spawn(cmd, env)
 
     die(f"Unsupported proxy kind: {kind}")
     return None
@@ -222,39 +404,58 @@ def start_proxy(kind: ProxyKind, listen_host: str, listen_port: int, reverse_tar
 
 def run_command(cmd: list[str], env: dict) -> subprocess.Popen:
     """Run a command and return the process handle."""
-    return subprocess.Popen(cmd, env=env)
+    return _spawn(cmd, env)
+
+
+# Set from signal handlers; polled on the main thread so shutdown never runs
+# in signal context.
+_stop = threading.Event()
+
+
+def _request_stop(*_) -> None:
+    _stop.set()
 
 
 def run_client(client: ClientCfg, env: dict) -> int:
-    proc = subprocess.Popen(client.cmd + client.args, env=env)
+    proc = _spawn(client.cmd + client.args, env)
+    # Poll rather than block in wait() so a signal-set event is honored
+    # promptly from the main thread.
+    while proc.poll() is None:
+        if _stop.wait(0.1):
+            proc.terminate()
+            break
     return proc.wait()
 
 
 def shutdown_all(procs: list[subprocess.Popen]) -> None:
-    # Terminate in reverse order
-    for p in procs[::-1]:
-        if p and p.poll() is None:
-            p.terminate()
-    # Wait then kill if needed
-    for p in procs[::-1]:
-        if p and p.poll() is None:
-            try:
-                p.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                p.kill()
-
-
-def build_env(base_env: dict, cfg: Config) -> dict:
-    env = base_env.copy()
-    # Knobs your client/agent can read
-    env["AGENT_PROVIDER"] = cfg.agent_provider
-    env["MODEL_PROVIDER"] = cfg.model_provider
-    env["TRACING_API"] = f"http://{cfg.tracing_api.host}:{cfg.tracing_api.port}"
-    # Proxy for HTTP(S) if enabled; do not override if already set outside
-    if cfg.proxy.enabled and cfg.proxy.kind != "none":
-        proxy_url = f"http://{cfg.proxy.listen_host}:{cfg.proxy.listen_port}"
-        env.setdefault("BASE_URL", proxy_url)
-    return env
+    # Single liveness pass, terminating in reverse order
+    live = [p for p in reversed(procs) if p and p.poll() is None]
+    for p in live:
+        p.terminate()
+    # One shared 5s deadline across all children, then kill stragglers
+    deadline = time.monotonic() + 5
+    for p in live:
+        try:
+            p.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            p.kill()
+
+
+def build_env(base_env: dict, cfg: Config, extra: Optional[dict] = None) -> dict:
+    # Single dict-literal build: one pre-sized merge instead of copy + N sets.
+    # The result is built exactly once per `up` and the same object is shared
+    # (read-only) by every Popen — each child serializes it independently.
+    # Knobs your client/agent can read; BASE_URL points at the proxy when
+    # enabled, but is not overridden if already set outside.
+    use_proxy = cfg.proxy.enabled and cfg.proxy.kind is not ProxyKind.none and "BASE_URL" not in base_env
+    return {
+        **base_env,
+        "AGENT_PROVIDER": cfg.agent_provider,
+        "MODEL_PROVIDER": cfg.model_provider,
+        "TRACING_API": f"http://{cfg.tracing_api.host}:{cfg.tracing_api.port}",
+        **({"BASE_URL": f"http://{cfg.proxy.listen_host}:{cfg.proxy.listen_port}"} if use_proxy else {}),
+        **(extra or {}),
+    }
 
 
 # ----------------------------
@@ -293,47 +494,40 @@ def up(
         if not reverse_target:
             die(f"No reverse target defined for model_provider '{cfg.model_provider}' in lookups.model_reverse_target")
 
-    # Resolve MCP variants for the selected agent provider
-    agent_key = cfg.agent_provider
-    agent_mcp = lookups.mcp.get(agent_key)
-    if not agent_mcp:
-        die(f"No MCP lookups for agent '{agent_key}' in lookups.mcp")
+    # Resolve MCP variants for the selected agent provider (one pass over the
+    # lookups table; downstream code reads attributes, not nested dicts)
+    mcp = resolve_mcp(lookups, cfg.agent_provider, cfg.mcp_server_variant, cfg.mcp_client_variant)
 
-    server_def = (agent_mcp.get("servers") or {}).get(cfg.mcp_server_variant)
-    client_def = (agent_mcp.get("clients") or {}).get(cfg.mcp_client_variant)
+    _launch(cfg, mcp, reverse_target)
 
-    if not server_def:
-        die(f"No MCP server variant '{cfg.mcp_server_variant}' for agent '{agent_key}'")
-    if not client_def:
-        die(f"No MCP client variant '{cfg.mcp_client_variant}' for agent '{agent_key}'")
+
+def _launch(cfg: Config, mcp: ResolvedMcp, reverse_target: Optional[str]) -> NoReturn:
+    """Start tracing API, proxy, and MCP server, then run the client to completion."""
+    server_type = mcp.server_type
 
     # Validate server/client transports align
-    server_type = str(server_def.get("type"))
-    client_type = str(client_def.get("type"))
-    if server_type != client_type:
+    if mcp.server_type != mcp.client_type:
         die(
-            f"MCP server/client transport mismatch: server='{server_type}' vs client='{client_type}'. "
+            f"MCP server/client transport mismatch: server='{mcp.server_type}' vs client='{mcp.client_type}'. "
             f"Pick matching variants."
         )
 
-    # Prepare environment for downstream processes
-    env = build_env(os.environ, cfg)
-    env["MCP_AGENT_PROVIDER"] = cfg.agent_provider
-    env["MCP_SERVER_VARIANT"] = cfg.mcp_server_variant
-    env["MCP_CLIENT_VARIANT"] = cfg.mcp_client_variant
-    env["MCP_TRANSPORT"] = server_type  # stdio | http
-
-    # Client needs to know how to connect
-    client_cfg_path = client_def.get("client_path")
-    if client_cfg_path:
-        env["MCP_CLIENT_CONFIG"] = str(client_cfg_path)
-
     http_url = None
     if server_type == "http":
-        http_url = server_def.get("url")
+        http_url = mcp.server_url
         if not http_url:
             die("HTTP MCP server requires a 'url' field in lookups.mcp.<agent>.servers.<variant>")
-        env["MCP_SERVER_URL"] = str(http_url)
+
+    # Prepare environment for downstream processes — one build, shared by all
+    env = build_env(os.environ, cfg, {
+        "MCP_AGENT_PROVIDER": cfg.agent_provider,
+        "MCP_SERVER_VARIANT": cfg.mcp_server_variant,
+        "MCP_CLIENT_VARIANT": cfg.mcp_client_variant,
+        "MCP_TRANSPORT": server_type,  # stdio | http
+        # Client needs to know how to connect
+        **({"MCP_CLIENT_CONFIG": mcp.client_path} if mcp.client_path else {}),
+        **({"MCP_SERVER_URL": http_url} if http_url else {}),
+    })
 
     # Lifecycle management
     procs: list[subprocess.Popen] = []
@@ -342,51 +536,135 @@ def up(
         shutdown_all(procs)
         raise SystemExit(code)
 
-    def _handle_sig(*_):
-        _shutdown_and_exit(130)
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
 
-    signal.signal(signal.SIGINT, _handle_sig)
-    signal.signal(signal.SIGTERM, _handle_sig)
+    # Spawn everything up front, then wait on all ports concurrently so total
+    # startup latency is max(wait) rather than sum(wait).
+    waits: list[tuple[str, str, int, float]] = []  # (name, host, port, timeout)
 
     # 1) tracing api
     tproc = start_tracing_api(cfg.tracing_api, env)
     procs.append(tproc)
-    if not wait_port(cfg.tracing_api.host, cfg.tracing_api.port, timeout=20):
-        die("Tracing API failed to start or open its port")
+    waits.append(("Tracing API", cfg.tracing_api.host, cfg.tracing_api.port, 20.0))
 
     # 2) proxy (optional)
-    if cfg.proxy.enabled and cfg.proxy.kind != "none":
+    if cfg.proxy.enabled and cfg.proxy.kind is not ProxyKind.none:
         pproc = start_proxy(cfg.proxy.kind, cfg.proxy.listen_host, cfg.proxy.listen_port, reverse_target, env)
         if pproc:
             procs.append(pproc)
-            if not wait_port(cfg.proxy.listen_host, cfg.proxy.listen_port, timeout=20):
-                die("Proxy failed to start or open its port")
+            waits.append(("Proxy", cfg.proxy.listen_host, cfg.proxy.listen_port, 20.0))
 
     # 3) MCP server (variant dependent)
+    stdio_grace = False
     if server_type == "stdio":
-        if server_def.get("cmd"):
-            mproc = run_command(list(server_def.get("cmd", [])), env)
+        if mcp.server_cmd:
+            mproc = run_command(mcp.server_cmd, env)
             procs.append(mproc)
             # light grace period; for robust readiness, implement a ping if your server supports it
-            time.sleep(0.5)
+            stdio_grace = True
     elif server_type == "http":
-        if not http_url:
-            die("Internal: missing http_url after server_type=='http'")
-        mproc = run_command(list(server_def.get("cmd", [])), env)
+        mproc = run_command(mcp.server_cmd, env)
         procs.append(mproc)
         u = urlparse(http_url)
         host = u.hostname
         port = u.port or (443 if u.scheme == "https" else 80)
         if not host:
             die(f"Invalid MCP HTTP URL: {http_url}")
-        if not wait_port(host, port, timeout=25):
-            die(f"MCP HTTP server failed to open {host}:{port}")
+        waits.append((f"MCP HTTP server ({host}:{port})", host, port, 25.0))
     else:
         die(f"Unsupported MCP server type: {server_type}")
 
+    failed = wait_ports(waits)
+    if failed:
+        shutdown_all(procs)
+        die(f"{failed} failed to start or open its port")
+
+    if stdio_grace:
+        time.sleep(0.5)
+
     # 4) client (blocks until completion)
     exit_code = run_client(cfg.client, env)
-    _shutdown_and_exit(exit_code)
+    _shutdown_and_exit(130 if _stop.is_set() else exit_code)
+
+
+def run_baked(cfg_dict: dict, mcp_dict: dict, reverse_target: Optional[str],
+              config_path: str, config_mtime_ns: int, profile: Optional[str],
+              env_file: str = ".env") -> None:
+    """Entry point for generated launchers: start from pre-resolved config.
+
+    Skips YAML parsing, profile merging, and lookup resolution entirely unless
+    the source config changed since the launcher was baked, in which case it
+    falls back to the full loader.
+    """
+    load_dotenv(env_file, override=False)
+
+    try:
+        stale = os.stat(config_path).st_mtime_ns != config_mtime_ns
+    except OSError:
+        stale = False
+    if stale:
+        cfg, lookups, _raw = load_all(config_path, profile)
+        reverse_target = lookups.model_reverse_target.get(cfg.model_provider)
+        if cfg.proxy.enabled and not reverse_target:
+            die(f"No reverse target defined for model_provider '{cfg.model_provider}' in lookups.model_reverse_target")
+        mcp = resolve_mcp(lookups, cfg.agent_provider, cfg.mcp_server_variant, cfg.mcp_client_variant)
+    else:
+        cfg = Config.model_validate(cfg_dict)
+        mcp = ResolvedMcp.model_validate(mcp_dict)
+
+    _launch(cfg, mcp, reverse_target)
+
+
+_BAKED_TEMPLATE = '''#!/usr/bin/env python3
+"""Baked launcher generated by `orchestrator.py generate`. Do not edit.
+
+Source: {config_path} (profile: {profile_label})
+Falls back to the full YAML loader if the source config has changed.
+"""
+
+CONFIG_PATH = {config_path_lit}
+CONFIG_MTIME_NS = {mtime_ns}
+PROFILE = {profile_lit}
+REVERSE_TARGET = {reverse_target_lit}
+CFG = {cfg_lit}
+MCP = {mcp_lit}
+
+if __name__ == "__main__":
+    from orchestrator import run_baked
+
+    run_baked(CFG, MCP, REVERSE_TARGET, CONFIG_PATH, CONFIG_MTIME_NS, PROFILE)
+'''
+
+
+@app.command()
+def generate(
+        profile: Optional[str] = typer.Option(None, help="Profile name from orchestrator.yaml"),
+        config_path: str = typer.Option("orchestrator.yaml", help="Path to config file"),
+        out: Optional[str] = typer.Option(None, help="Output path (default: launcher_<profile>.py)"),
+):
+    """Bake a profile into a launcher that skips config parsing at runtime."""
+    cfg, lookups, _raw = load_all(config_path, profile)
+
+    reverse_target = lookups.model_reverse_target.get(cfg.model_provider)
+    if cfg.proxy.enabled and not reverse_target:
+        die(f"No reverse target defined for model_provider '{cfg.model_provider}' in lookups.model_reverse_target")
+
+    mcp = resolve_mcp(lookups, cfg.agent_provider, cfg.mcp_server_variant, cfg.mcp_client_variant)
+
+    out = out or f"launcher_{profile or 'default'}.py"
+    script = _BAKED_TEMPLATE.format(
+        config_path=config_path,
+        profile_label=profile or "defaults",
+        config_path_lit=repr(str(Path(config_path).resolve())),
+        mtime_ns=os.stat(config_path).st_mtime_ns,
+        profile_lit=repr(profile),
+        reverse_target_lit=repr(reverse_target),
+        cfg_lit=repr(cfg.model_dump(mode="json")),
+        mcp_lit=repr(mcp.model_dump(mode="json")),
+    )
+    Path(out).write_text(script)
+    typer.secho(f"Wrote {out}", fg=typer.colors.GREEN)
 
 
 # ----------------------------
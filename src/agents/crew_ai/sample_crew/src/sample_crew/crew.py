@@ -1,6 +1,7 @@
+import functools
 import os
 
-from crewai import Agent, Crew, Process, Task, LLM
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from typing import List
@@ -17,7 +18,14 @@ MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://127.0.0.1:8000/mcp")
 BASE_URL = os.getenv("BASE_URL", None)
 
 
+@functools.cache
 def get_llm():
+    # Cached: the config is fully determined by MODEL_PROVIDER/BASE_URL, so
+    # all three agents share one LLM client (and its connection pool).
+    # Imported lazily so the litellm provider adapters only load when an LLM
+    # is actually built (same pattern as the langchain client).
+    from crewai import LLM
+
     match MODEL_PROVIDER:
         case "openai":
 
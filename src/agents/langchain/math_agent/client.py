@@ -1,7 +1,6 @@
 # Create server parameters for stdio connection
 import os
 
-import httpx
 from langchain_core.messages import SystemMessage
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
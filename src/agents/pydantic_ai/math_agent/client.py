@@ -1,7 +1,5 @@
 import os
-from datetime import datetime
 
-import logfire
 from dotenv import load_dotenv
 from pydantic_ai import Agent
 import random
@@ -13,19 +11,38 @@ from pydantic_ai.mcp import MCPServerStreamableHTTP, MCPServerStdio
 
 load_dotenv()
 
+# Dedicated generator with its bound method pre-looked-up: the tool path
+# skips the random-module attribute chase on every call.
+_rng = random.Random()
+_randint = _rng.randint
+
 MODEL_PROVIDER = os.getenv("MODEL_PROVIDER", "openai")
 MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "stdio")
 MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:8000/mcp")
 BASE_URL = os.getenv("BASE_URL", None)
 TRACING_API = os.getenv("TRACING_API", "http://localhost:7000")
 if BASE_URL:
-    os.environ[
-        'OTEL_EXPORTER_OTLP_TRACES_ENDPOINT'] = f"{TRACING_API}/otel/traces/pydantic-ai-runner-{datetime.now().isoformat()}"
+    # Stable endpoint so the OTLP exporter can reuse its keep-alive
+    # connection; per-run disambiguation happens in the collector's
+    # timestamped file names.
+    os.environ['OTEL_EXPORTER_OTLP_TRACES_ENDPOINT'] = f"{TRACING_API}/otel/traces/pydantic-ai-runner"
 
-logfire.configure(send_to_logfire="if-token-present")
-logfire.instrument_pydantic_ai()
 EXTRA_HEADERS = {"alltrue-endpoint-identifier": "pydantic-ai-runner"} if BASE_URL else {}
 
+_logfire_configured = False
+
+
+def _configure_logfire() -> None:
+    # Deferred so importing this module doesn't pay logfire's setup cost;
+    # only the actual agent run needs instrumentation.
+    global _logfire_configured
+    if _logfire_configured:
+        return
+    import logfire
+    logfire.configure(send_to_logfire="if-token-present")
+    logfire.instrument_pydantic_ai()
+    _logfire_configured = True
+
 def get_model(provider: str, base_url: str | None = None):
     if provider == "openai":
         api_key = os.environ["OPENAI_API_KEY"]
@@ -101,9 +118,14 @@ def get_server(server_type: str):
 agent = Agent(toolsets=[get_server(server_type=MCP_TRANSPORT)], instrument=True,
               system_prompt="""
 You are an agent that is designed to demonstrate simple statistical properties of random variables.
-You will be given access to two tools: 
+You will be given access to these tools:
 1. random_number(start: int, end: int) -> int: this can help you generate random numbers from a uniform distribution between 'start' and 'end'.
-2. add(a: int, b: int) -> int: this can help you add two integers together.
+2. random_numbers(start: int, end: int, count: int) -> list[int]: this draws 'count' random numbers from the same distribution in one call.
+3. add(a: int, b: int) -> int: this can help you add two integers together.
+4. add_many(xs: list[int], ys: list[int]) -> list[int]: this adds two equal-length lists of integers pairwise.
+5. mc_sum_mean(low_a: int, high_a: int, low_b: int, high_b: int, n: int) -> float: this runs the whole experiment — drawing n pairs, summing them, and averaging — in one call.
+
+Prefer a single mc_sum_mean call for the full experiment; otherwise prefer a single random_numbers call per distribution over many random_number calls, and a single add_many call over many add calls.
 
 Your task is to demonstrate that the sum of two uniform random variables has an expected value that is equal to the sum of their expected values.
 You should do this by repeatedly generating random numbers from two uniform distributions, summing them, and then calculating the average of these sums over many trials.
@@ -121,14 +143,45 @@ def random_number(start: int, end: int) -> int:
     """
     Returns a random number between 'start' and 'end'.
     """
-    return random.randint(start, end)
+    return _randint(start, end)
 
 
-async def main():
+@agent.tool_plain()
+def random_numbers(start: int, end: int, count: int) -> list[int]:
+    """
+    Returns 'count' random numbers between 'start' and 'end'.
+
+    Batched variant of random_number: one tool round-trip for all draws.
+    """
+    return [_randint(start, end) for _ in range(count)]
+
+
+DEFAULT_PROMPT = ('Demonstrate the expected value of the sum of two uniform random variables. '
+                  'Do so by drawing no more than 20 pairs of random numbers from two uniform distributions.')
+
+
+async def run_prompts(prompts: list[str]) -> list[str]:
+    """Run several prompts over one agent context.
+
+    The stdio MCP server is spawned (and handshaken) once per `async with
+    agent:` scope, so batching runs here amortizes that ~100ms across them.
+    """
+    _configure_logfire()
+    outputs: list[str] = []
     async with agent:
-        result = await agent.run('Demonstrate the expected value of the sum of two uniform random variables. '
-                                 'Do so by drawing no more than 20 pairs of random numbers from two uniform distributions.')
-    print(result.output)
+        for prompt in prompts:
+            result = await agent.run(prompt)
+            outputs.append(result.output)
+    return outputs
+
+
+async def run_prompt(prompt: str = DEFAULT_PROMPT) -> str:
+    outputs = await run_prompts([prompt])
+    return outputs[0]
+
+
+async def main():
+    print(await run_prompt())
 
 
 if __name__ == "__main__":
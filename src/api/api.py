@@ -1,14 +1,74 @@
+import functools
+import itertools
 import os
-import json
+import orjson
+from anyio import to_thread
 from datetime import datetime
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from google.protobuf.json_format import MessageToDict
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 from src.config import TRACES_DIR
 
+# When set, archive the OTLP payload bytes untouched (.pb) instead of
+# decoding to JSON — zero parsing on the ingest path.
+RAW_TRACES = os.getenv("RAW_TRACES") == "1"
+
+# Distinguishes files when two traces share the same isoformat timestamp
+_counter = itertools.count()
+
+
+@functools.lru_cache(maxsize=1024)
+def _ensure_dir(dir_path: str) -> str:
+    # Bounded cache collapses the per-request makedirs stat/mkdir syscalls
+    # to one per unique agent directory.
+    os.makedirs(dir_path, exist_ok=True)
+    return dir_path
+
+
+def _write_file(path: str, data: bytes) -> None:
+    # Direct-fd write: skip Python's buffered writer for one-shot payloads
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _encode(byte_data: bytes) -> bytes:
+    """CPU-heavy protobuf decode + JSON encode; run off the event loop.
+
+    Walks resource/scope/span levels directly and emits one jsonl line per
+    span, so only one span's dict exists at a time instead of the whole
+    trace tree.
+    """
+    msg = ExportTraceServiceRequest()
+    msg.ParseFromString(byte_data)
+    lines = []
+    for rs in msg.resource_spans:
+        resource = MessageToDict(rs.resource, preserving_proto_field_name=True)
+        for ss in rs.scope_spans:
+            scope = MessageToDict(ss.scope, preserving_proto_field_name=True)
+            for sp in ss.spans:
+                lines.append(orjson.dumps({
+                    "resource": resource,
+                    "scope": scope,
+                    "span": MessageToDict(sp, preserving_proto_field_name=True),
+                }))
+    lines.append(b"")  # trailing newline
+    return b"\n".join(lines)
+
+
+def _encode_pretty(byte_data: bytes) -> bytes:
+    """Indented whole-tree encode for human inspection; off the hot path."""
+    msg = ExportTraceServiceRequest()
+    msg.ParseFromString(byte_data)
+    msg_dict = MessageToDict(msg, preserving_proto_field_name=True)
+    return orjson.dumps(msg_dict, option=orjson.OPT_INDENT_2)
+
 
 @app.get("/")
 def home():
@@ -19,27 +79,43 @@ def home():
 async def write_otel_traces_to_local_file(
         *,
         agent_name: str | None = None,
-        request: Request
+        request: Request,
+        pretty: bool = False,
 ):
     byte_data = await request.body()
 
-    # Parse it
-    msg = ExportTraceServiceRequest()
-    msg.ParseFromString(byte_data)
-
-    msg_dict = MessageToDict(msg, preserving_proto_field_name=True)
-
-    file_name = datetime.now().isoformat() + "-trace.json"
+    if RAW_TRACES:
+        suffix = "-trace.pb"
+    elif pretty:
+        suffix = "-trace.json"
+    else:
+        suffix = "-trace.jsonl"
+    file_name = f"{datetime.now().isoformat()}-{os.getpid()}-{next(_counter)}{suffix}"
     if agent_name:
         file_name = f"{agent_name}/{file_name}"
     full_path = os.path.join(TRACES_DIR, file_name)
-    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-    with open(os.path.join(TRACES_DIR, file_name), "w") as f:
-        json.dump(msg_dict, f, indent=2)
+    _ensure_dir(os.path.dirname(full_path))
+
+    if RAW_TRACES:
+        data = byte_data
+    elif pretty:
+        data = await to_thread.run_sync(_encode_pretty, byte_data)
+    else:
+        data = await to_thread.run_sync(_encode, byte_data)
+
+    await to_thread.run_sync(_write_file, full_path, data)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="localhost", port=7000)
+    uvicorn.run(
+        app,
+        host="localhost",
+        port=7000,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False,
+    )
     # run with uvicorn src.api:app --reload
@@ -1,7 +1,11 @@
+import random
+
 from mcp.server.fastmcp import FastMCP
 
 app = FastMCP()
 
+_rng = random.Random()
+
 @app.tool()
 def add(a: int, b: int) -> int:
     """
@@ -10,5 +14,28 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
+@app.tool()
+def add_many(xs: list[int], ys: list[int]) -> list[int]:
+    """
+    Adds two equal-length lists of integers pairwise.
+
+    Batched variant of add: one call instead of one per pair.
+    """
+    return [x + y for x, y in zip(xs, ys, strict=True)]
+
+
+@app.tool()
+def mc_sum_mean(low_a: int, high_a: int, low_b: int, high_b: int, n: int) -> float:
+    """
+    Monte-carlo mean of the sum of two uniform integer variables.
+
+    Draws n pairs from uniform[low_a, high_a] and uniform[low_b, high_b],
+    sums each pair, and returns the average — the whole experiment in one
+    tool call.
+    """
+    total = sum(_rng.randint(low_a, high_a) + _rng.randint(low_b, high_b) for _ in range(n))
+    return total / n
+
+
 if __name__ == '__main__':
     app.run(transport='stdio')
@@ -1,7 +1,9 @@
 import os
 
 from mitmproxy import http
-import json
+import orjson
+import queue
+import threading
 import time
 import os
 
@@ -12,12 +14,40 @@ os.makedirs(PROXY_LOG_DIR, exist_ok=True)
 
 MAX_BODY_BYTES = 32_000  # keep logs small; adjust as needed
 
+# Flush policy: amortize write syscalls over many entries
+FLUSH_BYTES = 256 * 1024
+FLUSH_INTERVAL = 1.0  # seconds
+
+# Writer-thread batching/backpressure
+BATCH_SIZE = 128
+QUEUE_SOFT_LIMIT = 10_000  # beyond this, shed body samples to cap memory
+
+# Hot-path constants for the provider path rewrites
+_OPENAI_PATH = "/chat/completions"
+_OPENAI_PATH_FIXED = "/v1/chat/completions"
+_OPENAI_HOST_MARKER = "openai"
+_AZURE_HOST_MARKER = "openai.azure.com"
+_AZURE_PREFIX = "/openai"
+
+
+# Timestamps: CLOCK_REALTIME_COARSE is a vDSO read with ~1ms granularity —
+# plenty for traffic logs and much cheaper than a full CLOCK_REALTIME query.
+# Keeps the float-seconds "ts" schema.
+_COARSE_CLOCK = getattr(time, "CLOCK_REALTIME_COARSE", None)
+if _COARSE_CLOCK is not None:
+    def _ts() -> float:
+        return time.clock_gettime(_COARSE_CLOCK)
+else:  # non-Linux fallback
+    _ts = time.time
+
 
 def _safe_text(content: bytes | None) -> str | None:
     if not content:
         return None
+    # Clip before decoding so a multi-MB body costs O(MAX_BODY_BYTES);
+    # escaping happens once, when orjson serializes the outer entry.
     try:
-        return json.dumps(content.decode("utf-8", errors="replace"))[:MAX_BODY_BYTES]
+        return content[:MAX_BODY_BYTES].decode("utf-8", errors="replace")
     except Exception:
         return None
 
@@ -25,19 +55,72 @@ def _safe_text(content: bytes | None) -> str | None:
 class ReverseLogger:
     def __init__(self):
         path = os.path.join(PROXY_LOG_DIR, "http_traffic.jsonl")
-        self.out = open(path, "a", buffering=1)
+        # Binary append mode (O_APPEND): orjson emits bytes and concurrent
+        # writers can't interleave lines. Large buffer + periodic flush
+        # instead of a syscall per entry.
+        self.out = open(path, "ab", buffering=1 << 20)
+        self._pending_bytes = 0
+        self._last_flush = time.monotonic()
+        # Flow hooks only enqueue; a daemon thread does the encode + I/O so
+        # disk latency never sits on the proxy's request path.
+        self.q: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+
+    def _enqueue(self, entry: dict) -> None:
+        if self.q.qsize() > QUEUE_SOFT_LIMIT:
+            entry["body_sample"] = None
+        self.q.put(entry)
+
+    def _drain(self) -> None:
+        while True:
+            entry = self.q.get()
+            stop = entry is None
+            batch = []
+            if not stop:
+                batch.append(orjson.dumps(entry) + b"\n")
+                # Pull whatever else is already queued, up to a bounded batch
+                for _ in range(BATCH_SIZE - 1):
+                    try:
+                        nxt = self.q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        stop = True
+                        break
+                    batch.append(orjson.dumps(nxt) + b"\n")
+            if batch:
+                self.out.writelines(batch)
+                self._maybe_flush(sum(map(len, batch)))
+            if stop:
+                self.out.flush()
+                self.out.close()
+                return
+
+    def _maybe_flush(self, nbytes: int) -> None:
+        self._pending_bytes += nbytes
+        now = time.monotonic()
+        if self._pending_bytes > FLUSH_BYTES or now - self._last_flush > FLUSH_INTERVAL:
+            self.out.flush()
+            self._pending_bytes = 0
+            self._last_flush = now
+
+    def done(self) -> None:
+        # mitmproxy shutdown hook: drain the queue, then flush and close
+        self.q.put(None)
+        self._writer.join(timeout=5)
 
     def request(self, flow: http.HTTPFlow) -> None:
         r = flow.request
 
         # openai hack
-        if r.path == "/chat/completions" and "openai" in r.host:
-            r.path = "/v1/chat/completions"
+        if r.path == _OPENAI_PATH and _OPENAI_HOST_MARKER in r.host:
+            r.path = _OPENAI_PATH_FIXED
         # azure openai hack
-        elif "openai.azure.com" in r.host and not r.path.startswith("/openai"):
-            r.path = "/openai" + r.path
+        elif _AZURE_HOST_MARKER in r.host and not r.path.startswith(_AZURE_PREFIX):
+            r.path = _AZURE_PREFIX + r.path
         entry = {
-            "ts": time.time(),
+            "ts": _ts(),
             "event": "request",
             "method": r.method,
             "scheme": r.scheme,
@@ -45,25 +128,25 @@ class ReverseLogger:
             "port": r.port,
             "path": r.path,
             "http_version": r.http_version,
-            "headers": dict(r.headers),
+            "headers": list(r.headers.items()),
             "body_sample": _safe_text(r.raw_content),
         }
-        self.out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._enqueue(entry)
 
     def response(self, flow: http.HTTPFlow) -> None:
         if not flow.response:
             return
         s = flow.response
         entry = {
-            "ts": time.time(),
+            "ts": _ts(),
             "event": "response",
             "status_code": s.status_code,
             "reason": s.reason,
             "http_version": s.http_version,
-            "headers": dict(s.headers),
+            "headers": list(s.headers.items()),
             "body_sample": _safe_text(s.raw_content),
         }
-        self.out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._enqueue(entry)
 
 
 